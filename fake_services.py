@@ -0,0 +1,436 @@
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class FakeServiceConfig:
+    """Behaviour knobs for the stand-in GitHub / Jira / JSON server."""
+    latency: float = 0.0          # base delay added to every response, in seconds
+    jitter: float = 0.0           # extra uniform random delay on top of latency
+    error_rate: float = 0.0       # fraction of requests answered with a 5xx
+    rate_limit_rate: float = 0.0  # fraction of requests answered with a 429
+    retry_after: int = 1          # Retry-After value sent with 429 responses
+    payload_items: int = 20       # number of items in generic JSON payloads
+    max_stored: int = 1000        # created PRs / issues kept for GET, 0 disables storage
+    seed: Optional[int] = None
+
+
+class FakeServiceServer(ThreadingHTTPServer):
+    """Threaded HTTP server that keeps the shared state of the stand-in services."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: Tuple[str, int], config: FakeServiceConfig):
+        super().__init__(address, FakeServiceHandler)
+        self.config = config
+        self.lock = threading.Lock()
+        self.random = random.Random(config.seed)
+        self.status_counts: Dict[int, int] = {}
+        self.request_count = 0
+        self.next_pr_number = 1
+        self.next_issue_id = 10000
+        self.pulls: "OrderedDict[Tuple[str, str, int], Dict[str, Any]]" = OrderedDict()
+        self.issues: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.issue_keys: Dict[str, str] = {}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, status: int):
+        with self.lock:
+            self.request_count += 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "requests": self.request_count,
+                "status_counts": dict(sorted(self.status_counts.items())),
+            }
+
+    def roll_fault(self) -> Optional[int]:
+        """Decide whether the current request should fail with a 429 or a 5xx."""
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.config.rate_limit_rate:
+            return 429
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            return 500
+        return None
+
+    def _store(self, store: OrderedDict, key: Any, value: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Keep `value` under `key`, evicting the oldest entry beyond `max_stored`.
+        Returns the evicted value, if any. Caller must hold the lock.
+        """
+        if self.config.max_stored <= 0:
+            return None
+        store[key] = value
+        if len(store) > self.config.max_stored:
+            return store.popitem(last=False)[1]
+        return None
+
+    def find_pull(self, owner: str, repo: str, number: int) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            return self.pulls.get((owner, repo, number))
+
+    def find_issue(self, id_or_key: str) -> Optional[Dict[str, Any]]:
+        """Look an issue up by key or numeric id, as Jira does."""
+        with self.lock:
+            return self.issues.get(self.issue_keys.get(id_or_key, id_or_key))
+
+    def create_pull(self, owner: str, repo: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            number = self.next_pr_number
+            self.next_pr_number += 1
+        pull = {
+            "id": number,
+            "number": number,
+            "state": "open",
+            "title": payload["title"],
+            "body": payload.get("body", ""),
+            "head": {"ref": payload["head"]},
+            "base": {"ref": payload["base"]},
+            "html_url": f"https://github.com/{owner}/{repo}/pull/{number}",
+            "url": f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}",
+        }
+        with self.lock:
+            self._store(self.pulls, (owner, repo, number), pull)
+        return pull
+
+    def create_issue(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        project = fields["project"]["key"]
+        with self.lock:
+            issue_id = self.next_issue_id
+            self.next_issue_id += 1
+        key = f"{project}-{issue_id}"
+        created = {
+            "id": str(issue_id),
+            "key": key,
+            "self": f"{self.base_url}/rest/api/3/issue/{issue_id}",
+        }
+        issue = {"id": str(issue_id), "key": key, "fields": fields}
+        with self.lock:
+            if self.config.max_stored > 0:
+                self.issue_keys[issue["id"]] = key
+            evicted = self._store(self.issues, key, issue)
+            if evicted is not None:
+                self.issue_keys.pop(evicted["id"], None)
+        return created
+
+
+def _jira_field_errors(fields: Any) -> Dict[str, str]:
+    if not isinstance(fields, dict):
+        return {"fields": "Field 'fields' is required."}
+    errors = {}
+    project = fields.get("project")
+    if not isinstance(project, dict) or not isinstance(project.get("key"), str) or not project["key"]:
+        errors["project"] = "Specify a valid project ID or key"
+    if not isinstance(fields.get("summary"), str) or not fields["summary"]:
+        errors["summary"] = "You must specify a summary of the issue."
+    issuetype = fields.get("issuetype")
+    if not isinstance(issuetype, dict) or not isinstance(issuetype.get("name"), str) or not issuetype["name"]:
+        errors["issuetype"] = "Specify an issue type"
+    return errors
+
+
+class FakeServiceHandler(BaseHTTPRequestHandler):
+    """Routes requests to the imitated GitHub, Jira and generic JSON endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    server: FakeServiceServer
+
+    GITHUB_PULLS = re.compile(r"^/repos/([^/]+)/([^/]+)/pulls$")
+    GITHUB_PULL = re.compile(r"^/repos/([^/]+)/([^/]+)/pulls/(\d+)$")
+    JIRA_ISSUE = re.compile(r"^/rest/api/3/issue$")
+    JIRA_BULK = re.compile(r"^/rest/api/3/issue/bulk$")
+    JIRA_ISSUE_KEY = re.compile(r"^/rest/api/3/issue/([A-Za-z0-9_-]+)$")
+    JSON_ENDPOINT = re.compile(r"^/json/([A-Za-z0-9_.-]+)$")
+    STATS_PATH = "/_stats"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        body = self._read_body()
+        if body is None:
+            # The body was never read, so the connection cannot be reused.
+            self.close_connection = True
+            self._send_json(400, {"message": "Invalid Content-Length header"})
+            return
+        path = self.path.split("?", 1)[0]
+        if method == "GET" and path == self.STATS_PATH:
+            # Served outside fault injection and not counted, so a load generator in
+            # another process can read the totals without skewing them.
+            self._send(200, json.dumps(self.server.stats()).encode("utf-8"),
+                       {"Content-Type": "application/json"}, record=False)
+            return
+
+        self._delay()
+
+        fault = self.server.roll_fault()
+        if fault == 429:
+            self._send_json(429, {"message": "API rate limit exceeded"},
+                            {"Retry-After": str(self.server.config.retry_after),
+                             "X-RateLimit-Remaining": "0"})
+            return
+        if fault is not None:
+            self._send_json(fault, {"message": "Injected server error"})
+            return
+
+        routes = {
+            "GET": [
+                (self.GITHUB_PULL, self._get_pull),
+                (self.JIRA_ISSUE_KEY, self._get_issue),
+                (self.JSON_ENDPOINT, self._get_json),
+            ],
+            "POST": [
+                (self.GITHUB_PULLS, self._create_pull),
+                (self.JIRA_BULK, self._create_issues_bulk),
+                (self.JIRA_ISSUE, self._create_issue),
+            ],
+        }
+        for pattern, handler in routes[method]:
+            match = pattern.match(path)
+            if match:
+                if method == "POST":
+                    try:
+                        payload = json.loads(body or b"{}")
+                    except json.JSONDecodeError:
+                        self._send_json(400, {"message": "Problems parsing JSON"})
+                        return
+                    handler(payload, *match.groups())
+                else:
+                    handler(*match.groups())
+                return
+        self._send_json(404, {"message": "Not Found"})
+
+    # GitHub
+
+    def _create_pull(self, payload: Any, owner: str, repo: str):
+        if not isinstance(payload, dict):
+            self._send_json(400, {"message": "Body should be a JSON object"})
+            return
+        missing = [name for name in ("title", "head", "base")
+                   if not isinstance(payload.get(name), str) or not payload[name]]
+        if missing:
+            self._send_json(422, {
+                "message": "Validation Failed",
+                "errors": [{"resource": "PullRequest", "field": name, "code": "missing_field"}
+                           for name in missing],
+            })
+            return
+        self._send_json(201, self.server.create_pull(owner, repo, payload))
+
+    def _get_pull(self, owner: str, repo: str, number: str):
+        pull = self.server.find_pull(owner, repo, int(number))
+        if pull is None:
+            self._send_json(404, {"message": "Not Found"})
+            return
+        self._send_cacheable(pull)
+
+    # Jira
+
+    def _create_issue(self, payload: Any):
+        if not isinstance(payload, dict):
+            self._send_json(400, {"errorMessages": ["Request body must be a JSON object."], "errors": {}})
+            return
+        fields = payload.get("fields")
+        errors = _jira_field_errors(fields)
+        if errors:
+            self._send_json(400, {"errorMessages": [], "errors": errors})
+            return
+        self._send_json(201, self.server.create_issue(fields))
+
+    def _create_issues_bulk(self, payload: Any):
+        if not isinstance(payload, dict):
+            self._send_json(400, {"errorMessages": ["Request body must be a JSON object."], "errors": {}})
+            return
+        updates = payload.get("issueUpdates", [])
+        if not isinstance(updates, list):
+            self._send_json(400, {"errorMessages": [],
+                                  "errors": {"issueUpdates": "Field 'issueUpdates' must be a list."}})
+            return
+        issues, failures = [], []
+        for index, update in enumerate(updates):
+            fields = update.get("fields") if isinstance(update, dict) else None
+            errors = _jira_field_errors(fields)
+            if errors:
+                failures.append({
+                    "status": 400,
+                    "elementErrors": {"errorMessages": [], "errors": errors},
+                    "failedElementNumber": index,
+                })
+            else:
+                issues.append(self.server.create_issue(fields))
+        self._send_json(201, {"issues": issues, "errors": failures})
+
+    def _get_issue(self, id_or_key: str):
+        issue = self.server.find_issue(id_or_key)
+        if issue is None:
+            self._send_json(404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."],
+                                  "errors": {}})
+            return
+        self._send_cacheable(issue)
+
+    # Generic JSON
+
+    def _get_json(self, name: str):
+        items = [{"id": i, "name": f"{name}-{i}", "value": i * 7 % 101}
+                 for i in range(self.server.config.payload_items)]
+        self._send_cacheable({"name": name, "count": len(items), "items": items})
+
+    # Helpers
+
+    def _read_body(self) -> Optional[bytes]:
+        """Read the request body, or return None if Content-Length is negative or not a number."""
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            return None
+        if length < 0:
+            return None
+        return self.rfile.read(length) if length else b""
+
+    def _delay(self):
+        config = self.server.config
+        delay = config.latency
+        if config.jitter:
+            with self.server.lock:
+                delay += self.server.random.uniform(0, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _send_cacheable(self, data: Dict[str, Any]):
+        """Send a GET response with an ETag, answering 304 when If-None-Match matches."""
+        body = json.dumps(data).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if etag in (self.headers.get("If-None-Match") or ""):
+            self._send(304, b"", {"ETag": etag})
+            return
+        self._send(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+    def _send_json(self, status: int, data: Any, headers: Optional[Dict[str, str]] = None):
+        merged = {"Content-Type": "application/json"}
+        merged.update(headers or {})
+        self._send(status, json.dumps(data).encode("utf-8"), merged)
+
+    def _send(self, status: int, body: bytes, headers: Dict[str, str], record: bool = True):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+        if record:
+            self.server.record(status)
+
+
+@contextmanager
+def run_fake_services(config: Optional[FakeServiceConfig] = None,
+                      host: str = "127.0.0.1", port: int = 0) -> Iterator[FakeServiceServer]:
+    """
+    Runs the stand-in server on a background thread for the duration of the block.
+
+    Args:
+        config (FakeServiceConfig): Latency and fault injection settings.
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free one.
+
+    Yields:
+        FakeServiceServer: The running server, use `base_url` to point clients at it.
+    """
+    server = FakeServiceServer((host, port), config or FakeServiceConfig())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", type=float, default=0.0, help="Base response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 5xx responses")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds for 429s")
+    parser.add_argument("--payload-items", type=int, default=20, help="Items per generic JSON payload")
+    parser.add_argument("--max-stored", type=int, default=1000,
+                        help="Created PRs / issues kept for GET, 0 disables storage")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for fault injection")
+
+
+def config_from_args(args: argparse.Namespace) -> FakeServiceConfig:
+    return FakeServiceConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        payload_items=args.payload_items,
+        max_stored=args.max_stored,
+        seed=args.seed,
+    )
+
+
+def config_to_argv(config: FakeServiceConfig) -> List[str]:
+    """Inverse of config_from_args, for starting the server as a separate process."""
+    argv = [
+        "--latency", str(config.latency),
+        "--jitter", str(config.jitter),
+        "--error-rate", str(config.error_rate),
+        "--rate-limit-rate", str(config.rate_limit_rate),
+        "--retry-after", str(config.retry_after),
+        "--payload-items", str(config.payload_items),
+        "--max-stored", str(config.max_stored),
+    ]
+    if config.seed is not None:
+        argv += ["--seed", str(config.seed)]
+    return argv
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in GitHub / Jira / JSON server for offline load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    with run_fake_services(config_from_args(args), args.host, args.port) as server:
+        print(f"Stand-in services listening on {server.base_url}")
+        print(f"  GitHub: POST {server.base_url}/repos/<owner>/<repo>/pulls")
+        print(f"  Jira:   POST {server.base_url}/rest/api/3/issue, /rest/api/3/issue/bulk")
+        print(f"  JSON:   GET  {server.base_url}/json/<name>")
+        print(f"  Stats:  GET  {server.base_url}/_stats", flush=True)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"Stopping. {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
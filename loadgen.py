@@ -0,0 +1,327 @@
+import os
+import sys
+import json
+import time
+import logging
+import itertools
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from typing import Callable, Awaitable, Dict, Any, List, Iterator, Optional
+import psutil
+
+from fake_services import (
+    FakeServiceConfig, run_fake_services, add_config_arguments, config_from_args, config_to_argv
+)
+
+# Offline load generator for the workflow tools.
+# Each scenario points one tool at the stand-in server in fake_services.py and
+# drives it at a fixed concurrency, e.g.:
+#   python loadgen.py jira --requests 500 --concurrency 50 --latency 0.02 --error-rate 0.01
+# The server runs in a child process by default so that only the client side is
+# measured; pass --in-process to run it on threads inside this process instead.
+
+Operation = Callable[[int], Awaitable[bool]]
+
+LOADTEST_BRANCH = "feature/loadtest"
+
+
+class MemorySampler:
+    """Samples the process RSS on a background thread to capture the peak during a run."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.process = psutil.Process(os.getpid())
+        self.start_mb = self.peak_mb = self.end_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _rss_mb(self) -> float:
+        return self.process.memory_info().rss / 1024 / 1024
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, self._rss_mb())
+
+    def __enter__(self):
+        self.start_mb = self.peak_mb = self._rss_mb()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.end_mb = self._rss_mb()
+        self.peak_mb = max(self.peak_mb, self.end_mb)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def drive(operation: Operation, total: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Runs `operation` `total` times with at most `concurrency` calls in flight.
+
+    Args:
+        operation (Operation): Coroutine function taking the call index and returning success.
+        total (int): Number of calls to make.
+        concurrency (int): Maximum number of concurrent calls.
+
+    Returns:
+        Dict[str, Any]: Throughput, latency percentiles, memory and failure counts.
+    """
+    if total < 0:
+        raise ValueError(f"total must be >= 0, got {total}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    indices = itertools.count()
+    latencies: List[float] = []
+    failures: Dict[str, int] = {}
+
+    # A fixed pool of workers pulling indices keeps the harness's own cost
+    # proportional to `concurrency` rather than `total`.
+    async def worker():
+        for index in indices:
+            if index >= total:
+                return
+            start = time.perf_counter()
+            try:
+                ok = await operation(index)
+                reason = None if ok else "unsuccessful result"
+            except Exception as e:
+                reason = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            if reason:
+                failures[reason] = failures.get(reason, 0) + 1
+
+    with MemorySampler() as memory:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    completed = len(latencies)
+    failed = sum(failures.values())
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "succeeded": completed - failed,
+        "failed": failed,
+        "failures": failures,
+        "elapsed_s": elapsed,
+        "requests_per_s": completed / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        "rss_start_mb": memory.start_mb,
+        "rss_peak_mb": memory.peak_mb,
+        "rss_end_mb": memory.end_mb,
+    }
+
+
+@contextmanager
+def git_checkout_with_branch(branch: str) -> Iterator[str]:
+    """
+    Creates a throwaway clone whose `origin` is a local bare repo that already has `branch`,
+    and makes it the working directory so create_github_pr's `git ls-remote` stays offline.
+    """
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="loadgen-") as tmp:
+        remote = os.path.join(tmp, "origin.git")
+        work = os.path.join(tmp, "work")
+        git = ['git', '-c', 'user.name=loadgen', '-c', 'user.email=loadgen@localhost']
+        subprocess.run(['git', 'init', '--bare', '-q', remote], check=True)
+        subprocess.run(['git', 'init', '-q', work], check=True)
+        subprocess.run(git + ['-C', work, 'commit', '-q', '--allow-empty', '-m', 'loadgen'], check=True)
+        subprocess.run(['git', '-C', work, 'remote', 'add', 'origin', remote], check=True)
+        subprocess.run(['git', '-C', work, 'push', '-q', 'origin', f'HEAD:refs/heads/{branch}'], check=True)
+        os.chdir(work)
+        try:
+            yield work
+        finally:
+            os.chdir(previous)
+
+
+@contextmanager
+def fake_services_process(config: FakeServiceConfig) -> Iterator[str]:
+    """
+    Runs fake_services.py in a child process on a free port.
+
+    Yields:
+        str: Base URL of the running server.
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_services.py")
+    command = [sys.executable, script, "--port", "0"] + config_to_argv(config)
+    with subprocess.Popen(command, stdout=subprocess.PIPE, text=True) as process:
+        try:
+            line = process.stdout.readline()
+            if "listening on " not in line:
+                raise RuntimeError(f"Stand-in server failed to start: {line!r}")
+            yield line.rsplit("listening on ", 1)[1].strip()
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def fetch_server_stats(base_url: str) -> Dict[str, Any]:
+    with urllib.request.urlopen(f"{base_url}/_stats", timeout=10) as response:
+        stats = json.load(response)
+    stats["status_counts"] = {int(status): count for status, count in stats["status_counts"].items()}
+    return stats
+
+
+def github_operation(base_url: str, verbose: bool = False) -> Operation:
+    import test3
+
+    # Creating the FastMCP instance sets root logging to INFO, which makes httpx
+    # log every request to stderr inside the timed section.
+    if not verbose:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    test3.GITHUB_API_URL = base_url
+    test3.GITHUB_REPO_URL = "https://github.com/loadgen/standin.git"
+    test3.GITHUB_TOKEN = "ghp_loadgen"
+
+    async def operation(index: int) -> bool:
+        result = await test3.create_github_pr(
+            f"Load test PR {index}", "Generated by loadgen.py", LOADTEST_BRANCH, "main"
+        )
+        return result["success"]
+
+    return operation
+
+
+def jira_operation(base_url: str, executor: ThreadPoolExecutor) -> Operation:
+    import jira
+
+    jira.JIRA_BASE_URL = base_url
+    jira.JIRA_PROJECT_KEY = "LOAD"
+    jira.JIRA_EMAIL = "loadgen@localhost"
+    jira.JIRA_API_TOKEN = "loadgen"
+
+    async def operation(index: int) -> bool:
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(
+            executor, jira.create_jira_ticket, f"Load test ticket {index}", "Generated by loadgen.py"
+        )
+        return bool(key)
+
+    return operation
+
+
+def fetch_operation(base_url: str, batch_size: int) -> Operation:
+    import test1
+
+    async def operation(index: int) -> bool:
+        urls = [f"{base_url}/json/item-{index}-{n}" for n in range(batch_size)]
+        results = await test1.fetch_multiple_urls(urls)
+        return len(results) == batch_size and all(r.status == 200 for r in results)
+
+    return operation
+
+
+async def run_scenario(scenario: str, base_url: str, total: int, concurrency: int,
+                       batch_size: int, verbose: bool = False) -> Dict[str, Any]:
+    if scenario == "github":
+        with git_checkout_with_branch(LOADTEST_BRANCH):
+            return await drive(github_operation(base_url, verbose), total, concurrency)
+    if scenario == "jira":
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return await drive(jira_operation(base_url, executor), total, concurrency)
+    if scenario == "fetch":
+        return await drive(fetch_operation(base_url, batch_size), total, concurrency)
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def print_report(scenario: str, report: Dict[str, Any], server_stats: Optional[Dict[str, Any]] = None):
+    print(
+        f"[LoadTest] Scenario: {scenario} | Requests: {report['requests']} | "
+        f"Concurrency: {report['concurrency']} | Succeeded: {report['succeeded']} | "
+        f"Failed: {report['failed']}"
+    )
+    print(
+        f"[LoadTest] Throughput: {report['requests_per_s']:.1f} req/s | "
+        f"p50: {report['p50_ms']:.2f} ms | p99: {report['p99_ms']:.2f} ms | "
+        f"Max: {report['max_ms']:.2f} ms | Elapsed: {report['elapsed_s']:.2f}s"
+    )
+    print(
+        f"[LoadTest] Memory RSS: start {report['rss_start_mb']:.2f} MB | "
+        f"peak {report['rss_peak_mb']:.2f} MB | end {report['rss_end_mb']:.2f} MB"
+    )
+    if report["failures"]:
+        print(f"[LoadTest] Failures: {report['failures']}")
+    if server_stats:
+        print(f"[LoadTest] Server: {server_stats['requests']} HTTP requests | "
+              f"Status counts: {server_stats['status_counts']}")
+
+
+@contextmanager
+def tool_output(verbose: bool) -> Iterator[None]:
+    """Discards the tools' stdout unless `verbose`, without buffering it in memory."""
+    if verbose:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        yield
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for the GitHub, Jira and fetch tools")
+    parser.add_argument("scenario", choices=["github", "jira", "fetch"])
+    parser.add_argument("-n", "--requests", type=non_negative_int, default=200, help="Total tool calls to make")
+    parser.add_argument("-c", "--concurrency", type=positive_int, default=20, help="Tool calls in flight at once")
+    parser.add_argument("--batch-size", type=positive_int, default=10, help="URLs per fetch_multiple_urls call")
+    parser.add_argument("--base-url", default=None,
+                        help="Use an already running stand-in server instead of starting one")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Run the stand-in server on threads in this process (skews memory and latency)")
+    parser.add_argument("--verbose", action="store_true", help="Show the tools' own output")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    def run(base_url: str) -> Dict[str, Any]:
+        with tool_output(args.verbose):
+            return asyncio.run(run_scenario(args.scenario, base_url, args.requests,
+                                            args.concurrency, args.batch_size, args.verbose))
+
+    if args.base_url:
+        print_report(args.scenario, run(args.base_url.rstrip('/')))
+        return
+
+    if args.in_process:
+        with run_fake_services(config_from_args(args)) as server:
+            report = run(server.base_url)
+            print_report(args.scenario, report, server.stats())
+        return
+
+    with fake_services_process(config_from_args(args)) as base_url:
+        report = run(base_url)
+        print_report(args.scenario, report, fetch_server_stats(base_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,10 @@ import httpx
 from mcp.server.fastmcp import FastMCP
 
 
+mcp = FastMCP("devops-mcp-workflow")
+
+GITHUB_API_URL = "https://api.github.com"
+
 
 def get_default_branch():
     """Get the default branch (main or master)"""
@@ -71,7 +75,7 @@ async def create_github_pr(title: str, description: str, branch: str, base_branc
         
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
-                f'https://api.github.com/repos/{owner}/{repo}/pulls',
+                f'{GITHUB_API_URL}/repos/{owner}/{repo}/pulls',
                 json=pr_data,
                 headers=headers
             )
@@ -0,0 +1,144 @@
+import json
+import asyncio
+import http.client
+import urllib.request
+from urllib.error import HTTPError
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
+
+from fake_services import FakeServiceConfig, run_fake_services
+
+
+def request(url: str, data: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json", **(headers or {})})
+    try:
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.status, dict(response.headers), response.read()
+    except HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def issue_fields(project: str = "LOAD") -> Dict[str, Any]:
+    return {"fields": {"project": {"key": project}, "summary": "s", "issuetype": {"name": "Task"}}}
+
+
+@pytest.fixture
+def loadgen():
+    pytest.importorskip("psutil")
+    import loadgen
+    return loadgen
+
+
+def test_percentile(loadgen):
+    assert loadgen.percentile([], 50) == 0.0
+    assert loadgen.percentile([7.0], 99) == 7.0
+    assert loadgen.percentile([1, 2, 3, 4], 50) == 2
+    assert loadgen.percentile(list(range(1, 101)), 99) == 99
+    assert loadgen.percentile(list(range(1, 101)), 100) == 100
+
+
+def test_fault_split_and_retry_after():
+    config = FakeServiceConfig(rate_limit_rate=0.3, error_rate=0.3, retry_after=7, seed=42)
+    with run_fake_services(config) as server:
+        results = [request(f"{server.base_url}/json/x") for _ in range(200)]
+        stats = server.stats()
+
+    statuses = [status for status, _, _ in results]
+    assert set(statuses) == {200, 429, 500}
+    assert all(headers["Retry-After"] == "7" for status, headers, _ in results if status == 429)
+    assert stats["requests"] == 200
+    assert stats["status_counts"] == {s: statuses.count(s) for s in (200, 429, 500)}
+    # The seeded split should land near the configured rates.
+    assert 30 <= statuses.count(429) <= 90
+    assert 30 <= statuses.count(500) <= 90
+
+
+def test_etag_not_modified():
+    with run_fake_services(FakeServiceConfig(seed=1)) as server:
+        status, headers, body = request(f"{server.base_url}/json/items")
+        assert status == 200 and json.loads(body)["name"] == "items"
+        etag = headers["ETag"]
+
+        status, _, body = request(f"{server.base_url}/json/items", headers={"If-None-Match": etag})
+        assert status == 304 and body == b""
+
+        status, _, _ = request(f"{server.base_url}/json/items", headers={"If-None-Match": '"stale"'})
+        assert status == 200
+
+
+def test_max_stored_eviction_keeps_issue_keys_in_sync():
+    with run_fake_services(FakeServiceConfig(max_stored=2, seed=1)) as server:
+        created = [json.loads(request(f"{server.base_url}/rest/api/3/issue", issue_fields())[2])
+                   for _ in range(3)]
+
+        assert list(server.issues) == [c["key"] for c in created[1:]]
+        assert server.issue_keys == {c["id"]: c["key"] for c in created[1:]}
+        assert request(created[0]["self"])[0] == 404
+        assert request(f"{server.base_url}/rest/api/3/issue/{created[0]['key']}")[0] == 404
+        assert request(created[-1]["self"])[0] == 200
+        assert request(f"{server.base_url}/rest/api/3/issue/{created[-1]['key']}")[0] == 200
+
+
+def test_max_stored_zero_disables_storage():
+    with run_fake_services(FakeServiceConfig(max_stored=0, seed=1)) as server:
+        status, _, _ = request(f"{server.base_url}/rest/api/3/issue", issue_fields())
+        assert status == 201
+        assert not server.issues and not server.issue_keys
+
+
+@pytest.mark.parametrize("path, raw", [
+    ("/rest/api/3/issue", b"[1,2]"),
+    ("/rest/api/3/issue", b'{"fields": {"project": "X"}}'),
+    ("/rest/api/3/issue/bulk", b"[1,2]"),
+    ("/rest/api/3/issue/bulk", b'{"issueUpdates": 5}'),
+])
+def test_malformed_jira_bodies_get_400(path, raw):
+    with run_fake_services(FakeServiceConfig(seed=1)) as server:
+        req = urllib.request.Request(f"{server.base_url}{path}", data=raw,
+                                     headers={"Content-Type": "application/json"})
+        with pytest.raises(HTTPError) as error:
+            urllib.request.urlopen(req, timeout=5)
+        assert error.value.code == 400
+        assert "errors" in json.loads(error.value.read())
+
+
+@pytest.mark.parametrize("length", ["-1", "abc"])
+def test_invalid_content_length_gets_400(length):
+    with run_fake_services(FakeServiceConfig(seed=1)) as server:
+        host, port = server.server_address[:2]
+        connection = http.client.HTTPConnection(host, port, timeout=5)
+        connection.putrequest("POST", "/rest/api/3/issue")
+        connection.putheader("Content-Length", length)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        connection.close()
+
+
+def test_drive_with_stub_operation(loadgen):
+    async def operation(index: int) -> bool:
+        await asyncio.sleep(0)
+        if index % 5 == 0:
+            raise RuntimeError("boom")
+        return index % 5 != 1
+
+    report = asyncio.run(loadgen.drive(operation, 20, 3))
+
+    assert report["requests"] == 20
+    assert report["succeeded"] == 12
+    assert report["failed"] == 8
+    assert report["failures"] == {"RuntimeError": 4, "unsuccessful result": 4}
+    assert report["p50_ms"] <= report["p99_ms"] <= report["max_ms"]
+
+
+def test_drive_rejects_bad_arguments(loadgen):
+    async def operation(index: int) -> bool:
+        return True
+
+    with pytest.raises(ValueError):
+        asyncio.run(loadgen.drive(operation, 10, 0))
+    with pytest.raises(ValueError):
+        asyncio.run(loadgen.drive(operation, -1, 1))